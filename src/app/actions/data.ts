@@ -691,12 +691,19 @@ export async function getTeacherStudents(email: string) {
         const studentObjectIds = studentIds.map(id => new ObjectId(id));
         const students = await db.collection("users").find({ _id: { $in: studentObjectIds } }).toArray();
 
+        // Group progress by student in one pass instead of re-scanning per student
+        const progressByStudent = new Map<string, typeof progressDocs>();
+        for (const p of progressDocs) {
+            const docs = progressByStudent.get(p.userId);
+            if (docs) docs.push(p);
+            else progressByStudent.set(p.userId, [p]);
+        }
+
         return serializeMongoObject(students.map(student => {
             const studentId = student._id.toString();
-            const studentProgress = progressDocs.filter(p => p.userId === studentId);
-            const coursesTaken = courses.filter(c =>
-                studentProgress.some(p => p.courseId === c._id.toString())
-            );
+            const studentProgress = progressByStudent.get(studentId) || [];
+            const takenCourseIds = new Set(studentProgress.map(p => p.courseId));
+            const coursesTaken = courses.filter(c => takenCourseIds.has(c._id.toString()));
 
             const avgProgress = studentProgress.length > 0
                 ? Math.round(studentProgress.reduce((acc, curr) => acc + (curr.progress || 0), 0) / studentProgress.length)